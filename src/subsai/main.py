@@ -36,6 +36,19 @@ __copyright__ = "Copyright 2023,"
 __license__ = "GPLv3"
 __github__ = "https://github.com/abdeladim/subsai"
 
+# Hebrew models using HuggingFaceModel, the model_id is set to the model name
+_HEBREW_MODELS = frozenset({
+    'ivrit-ai/whisper-large-v2-tuned',
+    'ivrit-ai/whisper-large-v3',
+    'Shiry/whisper-large-v2-he',
+    'imvladikon/wav2vec2-large-xlsr-53-hebrew',
+})
+
+# Hebrew faster-whisper models, the model_size_or_path is set to the model name
+_FASTER_WHISPER_HEBREW_MODELS = frozenset({
+    'sivan22/faster-whisper-ivrit-ai-whisper-large-v2-tuned',
+})
+
 
 class SubsAI:
     """
@@ -93,28 +106,15 @@ class SubsAI:
 
         :return: the model instance
         """
-        # For Hebrew models using HuggingFaceModel, set the model_id to the model_name
-        hebrew_models = [
-            'ivrit-ai/whisper-large-v2-tuned',
-            'ivrit-ai/whisper-large-v3', 
-            'Shiry/whisper-large-v2-he',
-            'imvladikon/wav2vec2-large-xlsr-53-hebrew',
-        ]
-        
-        # For faster-whisper Hebrew model, set model_size_or_path
-        faster_whisper_hebrew_models = [
-            'sivan22/faster-whisper-ivrit-ai-whisper-large-v2-tuned',
-        ]
-        
         # Create a copy of model_config to avoid modifying the original
         config = model_config.copy()
         
         # If this is a Hebrew HuggingFace model and model_id is not explicitly set, use the model_name
-        if model_name in hebrew_models and 'model_id' not in config:
+        if model_name in _HEBREW_MODELS and 'model_id' not in config:
             config['model_id'] = model_name
             
         # If this is a Hebrew faster-whisper model and model_size_or_path is not explicitly set, use the model_name
-        if model_name in faster_whisper_hebrew_models and 'model_size_or_path' not in config:
+        if model_name in _FASTER_WHISPER_HEBREW_MODELS and 'model_size_or_path' not in config:
             config['model_size_or_path'] = model_name
         
         return AVAILABLE_MODELS[model_name]['class'](config)
@@ -210,15 +210,17 @@ class Tools:
             translation_model = model
 
         translated_subs = SSAFile()
-        for sub in subs:
+        if len(subs) == 0:
+            return translated_subs
+        # translate all the lines in one call so the model can batch them with `batch_size`
+        translated_texts = translation_model.translate(text=[sub.text for sub in subs],
+                                                       source=source_language,
+                                                       target=target_language,
+                                                       batch_size=translation_configs.get('batch_size', 32),
+                                                       verbose=translation_configs.get('verbose', False))
+        for sub, translated_text in zip(subs, translated_texts):
             translated_sub = sub.copy()
-            translated_sub.text = translation_model.translate(text=sub.text,
-                                                              source=source_language,
-                                                              target=target_language,
-                                                              batch_size=translation_configs[
-                                                                  'batch_size'] if 'batch_size' in translation_configs else 32,
-                                                              verbose=translation_configs[
-                                                                  'verbose'] if 'verbose' in translation_configs else False)
+            translated_sub.text = translated_text
             translated_subs.append(translated_sub)
         return translated_subs
 
@@ -58,7 +58,20 @@ class OoonaConverter:
         
         self.access_token = None
         self.token_expires_at = None
-    
+
+        # Reuse one HTTP session so the token and conversion requests share pooled connections
+        self.session = requests.Session()
+
+    def close(self) -> None:
+        """Close the HTTP session and release its pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> 'OoonaConverter':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
     def authenticate(self) -> Dict[str, Any]:
         """
         Authenticate with OOONA API and get access token.
@@ -87,7 +100,7 @@ class OoonaConverter:
                 'name': self.api_name
             }
             
-            response = requests.post(
+            response = self.session.post(
                 token_url,
                 data=data,
                 timeout=30
@@ -170,7 +183,7 @@ class OoonaConverter:
                 with open(temp_file_path, 'rb') as file:
                     files = {'': file}  # Empty key as per API spec
                     
-                    response = requests.post(
+                    response = self.session.post(
                         convert_url,
                         headers=headers,
                         files=files,
@@ -257,8 +270,8 @@ def create_ooona_converter() -> Optional[OoonaConverter]:
         return OoonaConverter()
         
     except OoonaConverterError as e:
-        logger.error(f"Failed to create OOONA converter: {str(e)}")
+        logger.error("Failed to create OOONA converter: %s", e)
         return None
     except Exception as e:
-        logger.error(f"Unexpected error creating OOONA converter: {str(e)}")
+        logger.error("Unexpected error creating OOONA converter: %s", e)
         return None
\ No newline at end of file
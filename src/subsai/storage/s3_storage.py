@@ -2,6 +2,7 @@
 S3 Storage service for subtitle files.
 """
 import os
+import re
 import logging
 from pathlib import Path
 from typing import Optional, Dict, Any, List
@@ -16,6 +17,20 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Characters not allowed in S3 key names and runs of hyphens left by replacing them
+_INVALID_KEY_CHARS_RE = re.compile(r'[^\w\-_.]')
+_REPEATED_HYPHENS_RE = re.compile(r'-+')
+
+# MIME types of the subtitle formats uploaded to S3
+_CONTENT_TYPES = {
+    'srt': 'text/plain',
+    'vtt': 'text/vtt',
+    'ass': 'text/plain',
+    'ssa': 'text/plain',
+    'ttml': 'application/ttml+xml',
+    'sbv': 'text/plain'
+}
+
 
 class S3StorageError(Exception):
     """Custom exception for S3 storage operations."""
@@ -138,7 +153,7 @@ class S3Storage:
             
             s3_url = f"s3://{self.bucket_name}/{s3_key}"
             
-            logger.info(f"Successfully uploaded subtitle to S3: {s3_url}")
+            logger.info("Successfully uploaded subtitle to S3: %s", s3_url)
             
             return {
                 "success": True,
@@ -210,14 +225,12 @@ class S3Storage:
             List of project folder names
         """
         try:
-            response = self.s3_client.list_objects_v2(
-                Bucket=self.bucket_name,
-                Delimiter='/'
-            )
+            paginator = self.s3_client.get_paginator('list_objects_v2')
+            pages = paginator.paginate(Bucket=self.bucket_name, Delimiter='/')
             
             projects = []
-            if 'CommonPrefixes' in response:
-                for prefix in response['CommonPrefixes']:
+            for page in pages:
+                for prefix in page.get('CommonPrefixes', []):
                     # Remove trailing slash
                     project_name = prefix['Prefix'].rstrip('/')
                     projects.append(project_name)
@@ -225,7 +238,7 @@ class S3Storage:
             return sorted(projects)
             
         except Exception as e:
-            logger.error(f"Failed to list projects: {str(e)}")
+            logger.error("Failed to list projects: %s", e)
             return []
     
     def list_project_files(self, project_name: str) -> List[Dict[str, Any]]:
@@ -240,14 +253,12 @@ class S3Storage:
         """
         try:
             prefix = f"{project_name}/"
-            response = self.s3_client.list_objects_v2(
-                Bucket=self.bucket_name,
-                Prefix=prefix
-            )
+            paginator = self.s3_client.get_paginator('list_objects_v2')
+            pages = paginator.paginate(Bucket=self.bucket_name, Prefix=prefix)
             
             files = []
-            if 'Contents' in response:
-                for obj in response['Contents']:
+            for page in pages:
+                for obj in page.get('Contents', []):
                     # Skip folder markers
                     if obj['Key'].endswith('/'):
                         continue
@@ -264,7 +275,7 @@ class S3Storage:
             return sorted(files, key=lambda x: x['last_modified'], reverse=True)
             
         except Exception as e:
-            logger.error(f"Failed to list project files: {str(e)}")
+            logger.error("Failed to list project files: %s", e)
             return []
     
     def _generate_s3_key(self, project_name: str, filename: str, subtitle_format: str) -> str:
@@ -277,24 +288,15 @@ class S3Storage:
     
     def _sanitize_name(self, name: str) -> str:
         """Sanitize name for S3 key."""
-        import re
         # Replace spaces and special characters with hyphens
-        sanitized = re.sub(r'[^\w\-_.]', '-', name)
+        sanitized = _INVALID_KEY_CHARS_RE.sub('-', name)
         # Remove multiple consecutive hyphens
-        sanitized = re.sub(r'-+', '-', sanitized)
+        sanitized = _REPEATED_HYPHENS_RE.sub('-', sanitized)
         return sanitized.strip('-')
     
     def _get_content_type(self, subtitle_format: str) -> str:
         """Get MIME type for subtitle format."""
-        content_types = {
-            'srt': 'text/plain',
-            'vtt': 'text/vtt',
-            'ass': 'text/plain',
-            'ssa': 'text/plain',
-            'ttml': 'application/ttml+xml',
-            'sbv': 'text/plain'
-        }
-        return content_types.get(subtitle_format.lower(), 'text/plain')
+        return _CONTENT_TYPES.get(subtitle_format.lower(), 'text/plain')
     
     def _get_bucket_region(self) -> Optional[str]:
         """Get bucket region."""
@@ -326,5 +328,5 @@ def create_s3_storage(config: Dict[str, Any]) -> Optional[S3Storage]:
             secret_key=config.get('secret_key')
         )
     except Exception as e:
-        logger.error(f"Failed to create S3Storage: {str(e)}")
+        logger.error("Failed to create S3Storage: %s", e)
         return None
\ No newline at end of file
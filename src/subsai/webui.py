@@ -108,7 +108,7 @@ def _render_s3_config_ui():
                         'secret_key': aws_secret_key
                     }
                     
-                    s3_storage = create_s3_storage(s3_config)
+                    s3_storage = _create_s3_storage(s3_config)
                     if s3_storage:
                         result = s3_storage.validate_connection()
                         if result['success']:
@@ -256,6 +256,25 @@ def _media_file_base64(file_path, mime='video/mp4', start_time=0):
 
     return [{"type": mime, "src": f"data:{mime};base64,{data}#t={start_time}"}]
 
+def _session_media_file_base64(file_path, file_key):
+    """
+    Returns base64 of the media file, cached in the session state while the same file is previewed.
+    The cache is per session and holds only the current file, so each session keeps at most one encoded media file
+    in memory and sessions never share previews.
+
+    :param file_path: path of the file
+    :param file_key: identity of the file content
+                     (path and modification time for local files, upload id, name and size for uploaded files)
+
+    :return: base64 of the media file
+    """
+    cached = st.session_state.get('media_file_base64')
+    if cached is None or cached[0] != file_key:
+        cached = (file_key, _media_file_base64(file_path))
+        st.session_state['media_file_base64'] = cached
+    return cached[1]
+
+
 @st.cache_resource
 def _create_translation_model(model_name: str):
     """
@@ -270,6 +289,18 @@ def _create_translation_model(model_name: str):
     return translation_model
 
 
+@st.cache_resource
+def _create_s3_storage(s3_config: dict):
+    """
+    Returns an S3 storage client and caches it
+
+    :param s3_config: S3 configuration dict
+
+    :return: `S3Storage` instance or None if disabled/invalid
+    """
+    return create_s3_storage(s3_config)
+
+
 @st.cache_data
 def _transcribe(file_path, model_name, model_config):
     """
@@ -294,13 +325,12 @@ def _subs_df(subs):
 
     :return::class:`pandas.DataFrame`
     """
-    sub_table = []
-    if subs is not None:
-        for sub in subs:
-            row = [ms_to_str(sub.start, fractions=True), ms_to_str(sub.end, fractions=True), sub.text]
-            sub_table.append(row)
-
-    df = pd.DataFrame(sub_table, columns=['Start time', 'End time', 'Text'])
+    if subs is None:
+        subs = []
+    # build the columns directly instead of a list of rows that pandas has to transpose
+    df = pd.DataFrame({'Start time': [ms_to_str(sub.start, fractions=True) for sub in subs],
+                       'End time': [ms_to_str(sub.end, fractions=True) for sub in subs],
+                       'Text': [sub.text for sub in subs]})
     return df
 
 
@@ -367,11 +397,14 @@ def webui() -> None:
             file_mode = st.selectbox("Select file mode", ['Local path', 'Upload'], index=0,
                                      help='Use `Local Path` if you are on a local machine, or use `Upload` to '
                                           'upload your files if you are using a remote server')
+            file_key = None
             if file_mode == 'Local path':
                 file_path = st.text_input('Media file path', help='Absolute path of the media file')
             else:
                 uploaded_file = st.file_uploader("Choose a media file")
                 if uploaded_file is not None:
+                    # the temporary path changes on every rerun, so identify the upload by its unique id
+                    file_key = ('upload', uploaded_file.id, uploaded_file.name, uploaded_file.size)
                     temp_dir = tempfile.TemporaryDirectory()
                     tmp_dir_path = temp_dir.name
                     file_path = os.path.join(tmp_dir_path, uploaded_file.name)
@@ -426,7 +459,6 @@ def webui() -> None:
         transcribe_loading_placeholder = st.empty()
 
     if transcribe_button:
-        config_schema = SubsAI.config_schema(stt_model_name)
         if configs_mode == 'Manual':
             model_config = _get_config_from_session_state(stt_model_name, config_schema, notification_placeholder)
         else:
@@ -607,14 +639,18 @@ def webui() -> None:
         }
 
         if 'file_path' in st.session_state and st.session_state['file_path'] != '':
-            if os.path.getsize(file_path) > st.web.server.server.get_max_message_size_bytes():
-                print(f"Media file cannot be previewed: size exceeds the message size limit of {st.web.server.server.get_max_message_size_bytes() / int(1e6):.2f} MB.")
-                st.info(f'Media file cannot be previewed: size exceeds the size limit of {st.web.server.server.get_max_message_size_bytes() / int(1e6):.2f} MB.'
+            max_message_size = st.web.server.server.get_max_message_size_bytes()
+            if os.path.getsize(file_path) > max_message_size:
+                print(f"Media file cannot be previewed: size exceeds the message size limit of {max_message_size / int(1e6):.2f} MB.")
+                st.info(f'Media file cannot be previewed: size exceeds the size limit of {max_message_size / int(1e6):.2f} MB.'
                         f' But you can try to run the transcription as usual.', icon="🚨")
                 st.info(f' You can increase the limit by running: subsai-webui --server.maxMessageSize Your_desired_size_limit_in_MB')
                 st.info(f"If it didn't work, please use the command line interface instead.")
             else:
-                event = st_player(_media_file_base64(st.session_state['file_path']), **options, height=500, key="player")
+                if file_key is None:
+                    file_key = (file_path, os.path.getmtime(file_path))
+                media_file_data = _session_media_file_base64(st.session_state['file_path'], file_key)
+                event = st_player(media_file_data, **options, height=500, key="player")
 
     with st.expander('Export subtitles file'):
         media_file = Path(file_path)
@@ -696,8 +732,8 @@ def webui() -> None:
                                 "- OOONA_API_NAME")
                         return
                     
-                    # Convert to OOONA format using API
-                    with st.spinner("Converting to OOONA format using API..."):
+                    # Convert to OOONA format using API, closing the converter's HTTP session afterwards
+                    with ooona_converter, st.spinner("Converting to OOONA format using API..."):
                         # Generate SRT content as input
                         input_content = subs.to_string(format_='srt')
                         
@@ -730,7 +766,7 @@ def webui() -> None:
                 if save_s3 and s3_enabled:
                     with st.spinner("Uploading to S3..."):
                         s3_config = _get_s3_config_from_session_state()
-                        s3_storage = create_s3_storage(s3_config)
+                        s3_storage = _create_s3_storage(s3_config)
                         
                         if s3_storage:
                             result = s3_storage.upload_subtitle(
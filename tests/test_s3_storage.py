@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test file for the S3 storage module
+
+"""
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from subsai.storage.s3_storage import S3Storage
+
+
+class TestS3StorageListing(TestCase):
+
+    def _storage(self, pages):
+        """Returns an `S3Storage` whose client paginator yields `pages`, without creating a boto3 client"""
+        storage = S3Storage.__new__(S3Storage)
+        storage.bucket_name = 'test-bucket'
+        storage.region = 'us-east-1'
+        storage.s3_client = MagicMock()
+        storage.s3_client.get_paginator.return_value.paginate.return_value = iter(pages)
+        return storage
+
+    def test_list_projects_merges_pages(self):
+        storage = self._storage([
+            {'CommonPrefixes': [{'Prefix': 'b/'}]},
+            {},
+            {'CommonPrefixes': [{'Prefix': 'a/'}]},
+        ])
+        self.assertEqual(storage.list_projects(), ['a', 'b'])
+        storage.s3_client.get_paginator.assert_called_once_with('list_objects_v2')
+        storage.s3_client.get_paginator.return_value.paginate.assert_called_once_with(
+            Bucket='test-bucket', Delimiter='/')
+
+    def test_list_project_files_merges_pages_and_skips_folders(self):
+        storage = self._storage([
+            {'Contents': [
+                {'Key': 'project/', 'Size': 0, 'LastModified': 0},
+                {'Key': 'project/old.srt', 'Size': 10, 'LastModified': 1},
+            ]},
+            {},
+            {'Contents': [{'Key': 'project/new.vtt', 'Size': 20, 'LastModified': 2}]},
+        ])
+        files = storage.list_project_files('project')
+        self.assertEqual([f['filename'] for f in files], ['new.vtt', 'old.srt'])
+        self.assertEqual(files[0]['s3_url'], 's3://test-bucket/project/new.vtt')
+        storage.s3_client.get_paginator.return_value.paginate.assert_called_once_with(
+            Bucket='test-bucket', Prefix='project/')